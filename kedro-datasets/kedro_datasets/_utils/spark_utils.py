@@ -1,12 +1,11 @@
 from typing import TYPE_CHECKING, Union
 
-from pyspark.sql import SparkSession
-
 if TYPE_CHECKING:
     from databricks.connect import DatabricksSession
+    from pyspark.sql import SparkSession
 
 
-def get_spark() -> Union[SparkSession, "DatabricksSession"]:
+def get_spark() -> Union["SparkSession", "DatabricksSession"]:
     """
     Returns the SparkSession. In case databricks-connect is available we use it for
     extended configuration mechanisms and notebook compatibility,
@@ -24,6 +23,8 @@ def get_spark() -> Union[SparkSession, "DatabricksSession"]:
     except ImportError:
         # For "normal" spark sessions that don't use databricks-connect
         # we get spark normally
+        from pyspark.sql import SparkSession
+
         spark = SparkSession.builder.getOrCreate()
 
     return spark
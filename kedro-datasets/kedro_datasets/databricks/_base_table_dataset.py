@@ -5,27 +5,55 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any, ClassVar
+from enum import Enum
+from typing import TYPE_CHECKING, Any, ClassVar
 
-import pandas as pd
 from kedro.io.core import (
     AbstractVersionedDataset,
     DatasetError,
     Version,
     VersionNotFoundError,
 )
-from pyspark.sql import DataFrame
-from pyspark.sql.types import StructType
-from pyspark.sql.utils import AnalysisException, ParseException
 
 from kedro_datasets._utils.spark_utils import get_spark
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from pyspark.sql import DataFrame
+    from pyspark.sql.types import StructType
+
 logger = logging.getLogger(__name__)
-pd.DataFrame.iteritems = pd.DataFrame.items
+
+# compiled once so name validation skips the `re` cache lookup
+_NAMING_RE = re.compile(r"\b[0-9a-zA-Z_-]{1,}\b")
+
+
+class WriteMode(str, Enum):
+    """The modes in which data can be written into a table."""
+
+    OVERWRITE = "overwrite"
+    UPSERT = "upsert"
+    APPEND = "append"
+
+    def __str__(self) -> str:
+        return self.value
 
 
-@dataclass(frozen=True)
+def _patch_pandas_iteritems() -> None:
+    """Restores ``pandas.DataFrame.iteritems`` where pandas no longer has it.
+
+    pyspark<3.4 still calls ``DataFrame.iteritems``, which pandas 2.0 removed,
+    when converting pandas DataFrames to Spark DataFrames.
+    """
+    import pandas as pd
+
+    if not hasattr(pd.DataFrame, "iteritems"):
+        pd.DataFrame.iteritems = pd.DataFrame.items
+
+
+@dataclass(frozen=True, slots=True)
 class BaseTable:
     """Stores the definition of a base table.
 
@@ -33,19 +61,21 @@ class BaseTable:
     """
 
     # regex for tables, catalogs and schemas
-    _NAMING_REGEX: ClassVar[str] = r"\b[0-9a-zA-Z_-]{1,}\b"
-    _VALID_WRITE_MODES: ClassVar[list[str]] = field(
-        default=["overwrite", "upsert", "append"]
+    _NAMING_REGEX: ClassVar[str] = _NAMING_RE.pattern
+    _VALID_WRITE_MODES: ClassVar[frozenset[str]] = frozenset(
+        mode.value for mode in WriteMode
     )
-    _VALID_DATAFRAME_TYPES: ClassVar[list[str]] = field(default=["spark", "pandas"])
-    _VALID_FORMATS: ClassVar[list[str]] = field(
-        default=["delta", "parquet", "csv", "json", "orc", "avro", "text"]
+    _VALID_DATAFRAME_TYPES: ClassVar[frozenset[str]] = frozenset({"spark", "pandas"})
+    _VALID_FORMATS: ClassVar[frozenset[str]] = frozenset(
+        {"delta", "parquet", "csv", "json", "orc", "avro", "text"}
     )
+    # resolved once per class, see ``_collect_validators``
+    _VALIDATORS: ClassVar[tuple[Callable[[BaseTable], None], ...]] = ()
 
     database: str
     catalog: str | None
     table: str
-    write_mode: str | None
+    write_mode: WriteMode | str | None
     location: str | None
     dataframe_type: str
     primary_key: str | list[str] | None
@@ -53,6 +83,37 @@ class BaseTable:
     partition_columns: str | list[str] | None
     format: str = "delta"
     json_schema: dict[str, Any] | None = None
+    overwrite_schema: bool = False
+    # derived in ``__post_init__``, declared so that they get a slot
+    _parsed_schema: StructType | None = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    _full_location: str | None = field(
+        init=False, default=None, repr=False, compare=False
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # ``slots=True`` recreates the class, which breaks zero-argument super()
+        super(BaseTable, cls).__init_subclass__(**kwargs)
+        cls._VALIDATORS = cls._collect_validators()
+
+    @classmethod
+    def _collect_validators(cls) -> tuple[Callable[[BaseTable], None], ...]:
+        """Collects the validation methods declared on the class and its parents.
+
+        Methods are resolved on ``cls``, so overrides in subclasses take the
+        place of the parent implementation.
+
+        Returns:
+            tuple: The validation methods, in order of declaration.
+        """
+        names = dict.fromkeys(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in vars(klass)
+            if name.startswith("_validate_")
+        )
+        return tuple(getattr(cls, name) for name in names)
 
     def __post_init__(self):
         """Run validation methods if declared.
@@ -60,13 +121,15 @@ class BaseTable:
         The validation method can be a simple check
         that raises DatasetError.
 
-        The validation is performed by calling a function with the signature
-        `validate_<field_name>(self, value) -> raises DatasetError`.
+        The validation is performed by calling every method with the signature
+        `_validate_<name>(self) -> raises DatasetError`.
         """
-        for name in self.__dataclass_fields__.keys():
-            method = getattr(self, f"_validate_{name}", None)
-            if method:
-                method()
+        # the parsed schema is memoized by ``schema()``; set explicitly since
+        # subclasses without slots don't get the ``init=False`` default
+        object.__setattr__(self, "_parsed_schema", None)
+        object.__setattr__(self, "_full_location", self._resolve_full_location())
+        for validator in self._VALIDATORS:
+            validator(self)
 
     def _validate_format(self):
         """Validates the format of the table.
@@ -75,55 +138,47 @@ class BaseTable:
             DatasetError: If an invalid `format` is passed.
         """
         if self.format not in self._VALID_FORMATS:
-            valid_formats = ", ".join(self._VALID_FORMATS)
+            valid_formats = ", ".join(sorted(self._VALID_FORMATS))
             raise DatasetError(
                 f"Invalid `format` provided: {self.format}. "
                 f"`format` must be one of: {valid_formats}"
             )
 
-    def _validate_table(self):
-        """Validates table name.
-
-        Raises:
-            DatasetError: If the table name does not conform to naming constraints.
-        """
-        if not re.fullmatch(self._NAMING_REGEX, self.table):
-            raise DatasetError("Table does not conform to naming")
-
-    def _validate_database(self):
-        """Validates database name.
-
-        Raises:
-            DatasetError: If the dataset name does not conform to naming constraints.
-        """
-        if not re.fullmatch(self._NAMING_REGEX, self.database):
-            raise DatasetError("Database does not conform to naming")
-
-    def _validate_catalog(self):
-        """Validates catalog name.
+    def _validate_names(self):
+        """Validates the table, database and catalog names.
 
         Raises:
-            DatasetError: If the catalog name does not conform to naming constraints.
+            DatasetError: If any of the names does not conform to naming constraints.
         """
+        names = [("Table", self.table), ("Database", self.database)]
         if self.catalog:
-            if not re.fullmatch(self._NAMING_REGEX, self.catalog):
-                raise DatasetError("Catalog does not conform to naming")
+            names.append(("Catalog", self.catalog))
+        naming_re = (
+            _NAMING_RE
+            if self._NAMING_REGEX == _NAMING_RE.pattern
+            else re.compile(self._NAMING_REGEX)
+        )
+        for label, name in names:
+            if not naming_re.fullmatch(name):
+                raise DatasetError(f"{label} does not conform to naming")
 
     def _validate_write_mode(self):
-        """Validates the write mode.
+        """Validates the write mode and converts it to a ``WriteMode``.
 
         Raises:
             DatasetError: If an invalid `write_mode` is passed.
         """
-        if (
-            self.write_mode is not None
-            and self.write_mode not in self._VALID_WRITE_MODES
-        ):
-            valid_modes = ", ".join(self._VALID_WRITE_MODES)
+        if self.write_mode is None:
+            return
+        try:
+            write_mode = WriteMode(self.write_mode)
+        except ValueError as exc:
+            valid_modes = ", ".join(sorted(self._VALID_WRITE_MODES))
             raise DatasetError(
                 f"Invalid `write_mode` provided: {self.write_mode}. "
                 f"`write_mode` must be one of: {valid_modes}"
-            )
+            ) from exc
+        object.__setattr__(self, "write_mode", write_mode)
 
     def _validate_dataframe_type(self):
         """Validates the dataframe type.
@@ -132,7 +187,7 @@ class BaseTable:
             DatasetError: If an invalid `dataframe_type` is passed.
         """
         if self.dataframe_type not in self._VALID_DATAFRAME_TYPES:
-            valid_types = ", ".join(self._VALID_DATAFRAME_TYPES)
+            valid_types = ", ".join(sorted(self._VALID_DATAFRAME_TYPES))
             raise DatasetError(f"`dataframe_type` must be one of {valid_types}")
 
     def _validate_primary_key(self):
@@ -151,6 +206,14 @@ class BaseTable:
     def full_table_location(self) -> str | None:
         """Returns the full table location.
 
+        Returns:
+            str | None : Table location in the format catalog.database.table or None if database and table aren't defined.
+        """
+        return self._full_location
+
+    def _resolve_full_location(self) -> str | None:
+        """Builds the full table location from the table definition.
+
         Returns:
             str | None : Table location in the format catalog.database.table or None if database and table aren't defined.
         """
@@ -167,13 +230,15 @@ class BaseTable:
         Returns:
             StructType: The schema of the table.
         """
-        schema = None
-        try:
-            if self.json_schema is not None:
+        if self._parsed_schema is None and self.json_schema is not None:
+            from pyspark.sql.types import StructType
+
+            try:
                 schema = StructType.fromJson(self.json_schema)
-        except (KeyError, ValueError) as exc:
-            raise DatasetError(exc) from exc
-        return schema
+            except (KeyError, ValueError) as exc:
+                raise DatasetError(exc) from exc
+            object.__setattr__(self, "_parsed_schema", schema)
+        return self._parsed_schema
 
     def exists(self) -> bool:
         """Checks to see if the table exists.
@@ -181,9 +246,38 @@ class BaseTable:
         Returns:
             bool: Boolean of whether the table exists in the Spark session.
         """
+        from pyspark.sql.utils import AnalysisException, ParseException
+
+        spark = get_spark()
+        # ``Catalog.tableExists`` is only available from pyspark 3.3
+        if not hasattr(spark.catalog, "tableExists"):
+            return self._exists_in_current_catalog()
+        # the fully qualified name is resolved by the catalog itself, so the
+        # current catalog of the (shared) Spark session is never switched
+        try:
+            return spark.catalog.tableExists(self.full_table_location())
+        except ParseException:
+            # Spark<3.4 can't parse catalog.database.table names
+            return self._exists_in_current_catalog()
+        except AnalysisException as exc:
+            logger.warning("error occured while trying to find table: %s", exc)
+            return False
+
+    def _exists_in_current_catalog(self) -> bool:
+        """Checks to see if the table exists after switching to its catalog.
+
+        Fallback for Spark versions that can't resolve fully qualified table names
+        or don't provide ``Catalog.tableExists``.
+
+        Returns:
+            bool: Boolean of whether the table exists in the Spark session.
+        """
+        from pyspark.sql.utils import AnalysisException, ParseException
+
+        spark = get_spark()
         if self.catalog:
             try:
-                get_spark().sql(f"USE CATALOG `{self.catalog}`")
+                spark.sql(f"USE CATALOG `{self.catalog}`")
             except (ParseException, AnalysisException) as exc:
                 logger.warning(
                     "catalog %s not found or unity not enabled. Error message: %s",
@@ -191,9 +285,10 @@ class BaseTable:
                     exc,
                 )
         try:
+            if hasattr(spark.catalog, "tableExists"):
+                return spark.catalog.tableExists(self.table, self.database)
             return (
-                get_spark()
-                .sql(f"SHOW TABLES IN `{self.database}`")
+                spark.sql(f"SHOW TABLES IN `{self.database}`")
                 .filter(f"tableName = '{self.table}'")
                 .count()
                 > 0
@@ -203,6 +298,9 @@ class BaseTable:
             return False
 
 
+BaseTable._VALIDATORS = BaseTable._collect_validators()
+
+
 class BaseTableDataset(AbstractVersionedDataset):
     """``BaseTableDataset`` loads and saves data into managed delta tables or external tables on Databricks.
     Load and save can be in Spark or Pandas dataframes, specified in dataframe_type.
@@ -215,6 +313,32 @@ class BaseTableDataset(AbstractVersionedDataset):
     # for parallelism within a Spark pipeline please consider
     # using ``ThreadRunner`` instead.
     _SINGLE_PROCESS = True
+    # maps each write mode to its ``_save_<write_mode>`` method, see
+    # ``_collect_write_methods``
+    _WRITE_DISPATCH: ClassVar[
+        dict[WriteMode, Callable[[BaseTableDataset, DataFrame], None]]
+    ] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._WRITE_DISPATCH = cls._collect_write_methods()
+
+    @classmethod
+    def _collect_write_methods(
+        cls,
+    ) -> dict[WriteMode, Callable[[BaseTableDataset, DataFrame], None]]:
+        """Maps every valid write mode to the save method implementing it.
+
+        Methods are resolved on ``cls``, so overrides in subclasses take the
+        place of the parent implementation.
+
+        Returns:
+            dict: The save method for each write mode.
+        """
+        return {
+            write_mode: getattr(cls, f"_save_{write_mode.value}")
+            for write_mode in WriteMode
+        }
 
     def __init__(  # noqa: PLR0913
         self,
@@ -233,6 +357,7 @@ class BaseTableDataset(AbstractVersionedDataset):
         schema: dict[str, Any] | None = None,
         partition_columns: list[str] | None = None,
         owner_group: str | None = None,
+        overwrite_schema: bool = False,
         metadata: dict[str, Any] | None = None,
     ) -> None:
         """Creates a new instance of ``BaseTableDataset``.
@@ -270,6 +395,9 @@ class BaseTableDataset(AbstractVersionedDataset):
             owner_group: If table access control is enabled in your workspace,
                 specifying owner_group will transfer ownership of the table and database to
                 this owner. All databases should have the same owner_group. Defaults to None.
+            overwrite_schema: Whether an overwrite may also replace the schema
+                of the table. Applicable only for write_mode "overwrite".
+                Defaults to False.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
         Raises:
@@ -287,10 +415,14 @@ class BaseTableDataset(AbstractVersionedDataset):
             json_schema=schema,
             partition_columns=partition_columns,
             owner_group=owner_group,
+            overwrite_schema=overwrite_schema,
         )
 
         self.metadata = metadata
         self._version = version
+        # only a positive result is memoized, a table that is missing
+        # now may still be created by another dataset later in the run
+        self._exists_cache = False
 
         super().__init__(
             filepath=None,  # type: ignore[arg-type]
@@ -298,6 +430,23 @@ class BaseTableDataset(AbstractVersionedDataset):
             exists_function=self._exists,  # type: ignore[arg-type]
         )
 
+        # the table definition is immutable, so the description is built once
+        self._description: dict[str, str | list | None] = {
+            "catalog": self._table.catalog,
+            "database": self._table.database,
+            "table": self._table.table,
+            "format": self._table.format,
+            "location": self._table.location,
+            "write_mode": (
+                str(self._table.write_mode) if self._table.write_mode else None
+            ),
+            "dataframe_type": self._table.dataframe_type,
+            "primary_key": self._table.primary_key,
+            "version": str(self._version),
+            "owner_group": self._table.owner_group,
+            "partition_columns": self._table.partition_columns,
+        }
+
     def _create_table(  # noqa: PLR0913
         self,
         table: str,
@@ -311,6 +460,7 @@ class BaseTableDataset(AbstractVersionedDataset):
         json_schema: dict[str, Any] | None,
         partition_columns: list[str] | None,
         owner_group: str | None,
+        overwrite_schema: bool = False,
     ) -> BaseTable:
         """Creates a ``BaseTable`` instance with the provided attributes.
 
@@ -326,6 +476,7 @@ class BaseTableDataset(AbstractVersionedDataset):
             json_schema: The JSON schema of the table.
             partition_columns: The partition columns of the table.
             owner_group: The owner group of the table.
+            overwrite_schema: Whether overwrites may replace the table schema.
 
         Returns:
             ``BaseTable``: The new ``BaseTable`` instance.
@@ -342,11 +493,13 @@ class BaseTableDataset(AbstractVersionedDataset):
             partition_columns=partition_columns,
             owner_group=owner_group,
             primary_key=primary_key,
+            overwrite_schema=overwrite_schema,
         )
 
     def _load(self) -> DataFrame | pd.DataFrame:
         """Loads the version of data in the format defined in the init
         (spark|pandas dataframe).
+        If schema is provided, only its columns are loaded.
 
         Raises:
             VersionNotFoundError: If the version defined in
@@ -368,6 +521,10 @@ class BaseTableDataset(AbstractVersionedDataset):
                 raise VersionNotFoundError(self._version.load) from exc
         else:
             data = get_spark().table(self._table.full_table_location())
+        # project before collecting so dropped columns never reach the driver
+        schema = self._table.schema()
+        if schema:
+            data = data.select(*schema.fieldNames())
         if self._table.dataframe_type == "pandas":
             data = data.toPandas()
         return data
@@ -384,24 +541,29 @@ class BaseTableDataset(AbstractVersionedDataset):
         if self._table.write_mode is None:
             raise DatasetError(
                 "'save' can not be used in read-only mode. "
-                f"Change 'write_mode' value to {', '.join(self._table._VALID_WRITE_MODES)}"
+                f"Change 'write_mode' value to {', '.join(sorted(self._table._VALID_WRITE_MODES))}"
             )
+        # validation has coerced write_mode, and every WriteMode has a method
+        method = self._WRITE_DISPATCH[WriteMode(self._table.write_mode)]
+
+        if self._table.dataframe_type == "pandas":
+            _patch_pandas_iteritems()
         # filter columns specified in schema and match their ordering
         schema = self._table.schema()
         if schema:
             cols = schema.fieldNames()
             if self._table.dataframe_type == "pandas":
-                data = get_spark().createDataFrame(
-                    data.loc[:, cols], schema=self._table.schema()
-                )
+                # only copy the frame when its columns don't already match
+                if list(data.columns) != cols:
+                    data = data[cols]
+                data = get_spark().createDataFrame(data, schema=schema)
             else:
                 data = data.select(*cols)
         elif self._table.dataframe_type == "pandas":
             data = get_spark().createDataFrame(data)
 
-        method = getattr(self, f"_save_{self._table.write_mode}", None)
-        if method:
-            method(data)
+        method(self, data)
+        self._exists_cache = True
 
     def _save_append(self, data: DataFrame) -> None:
         """Saves the data to the table by appending it
@@ -422,7 +584,7 @@ class BaseTableDataset(AbstractVersionedDataset):
         if self._table.location:
             writer.option("path", self._table.location)
 
-        writer.saveAsTable(self._table.full_table_location() or "")
+        writer.saveAsTable(self._table.full_table_location())
 
     def _save_overwrite(self, data: DataFrame) -> None:
         """Overwrites the data in the table with the data provided.
@@ -430,11 +592,10 @@ class BaseTableDataset(AbstractVersionedDataset):
         Args:
             data (DataFrame): The Spark dataframe to overwrite the table with.
         """
-        writer = (
-            data.write.format(self._table.format)
-            .mode("overwrite")
-            .option("overwriteSchema", "true")
-        )
+        writer = data.write.format(self._table.format).mode("overwrite")
+
+        if self._table.overwrite_schema:
+            writer.option("overwriteSchema", "true")
 
         if self._table.partition_columns:
             writer.partitionBy(
@@ -446,7 +607,7 @@ class BaseTableDataset(AbstractVersionedDataset):
         if self._table.location:
             writer.option("path", self._table.location)
 
-        writer.saveAsTable(self._table.full_table_location() or "")
+        writer.saveAsTable(self._table.full_table_location())
 
     def _save_upsert(self, update_data: DataFrame) -> None:
         """Upserts the data by joining on primary_key columns or column.
@@ -493,19 +654,7 @@ class BaseTableDataset(AbstractVersionedDataset):
         Returns:
             Dict[str, str]: Dict with the details of the dataset.
         """
-        return {
-            "catalog": self._table.catalog,
-            "database": self._table.database,
-            "table": self._table.table,
-            "format": self._table.format,
-            "location": self._table.location,
-            "write_mode": self._table.write_mode,
-            "dataframe_type": self._table.dataframe_type,
-            "primary_key": self._table.primary_key,
-            "version": str(self._version),
-            "owner_group": self._table.owner_group,
-            "partition_columns": self._table.partition_columns,
-        }
+        return self._description.copy()
 
     def _exists(self) -> bool:
         """Checks to see if the table exists.
@@ -514,4 +663,9 @@ class BaseTableDataset(AbstractVersionedDataset):
             bool: Boolean of whether the table defined
             in the dataset instance exists in the Spark session.
         """
-        return self._table.exists()
+        if not self._exists_cache:
+            self._exists_cache = self._table.exists()
+        return self._exists_cache
+
+
+BaseTableDataset._WRITE_DISPATCH = BaseTableDataset._collect_write_methods()
@@ -4,23 +4,21 @@ in Databricks.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any, ClassVar
 
-import pandas as pd
 from kedro.io.core import Version
 
 from kedro_datasets.databricks._base_table_dataset import BaseTable, BaseTableDataset
 
 logger = logging.getLogger(__name__)
-pd.DataFrame.iteritems = pd.DataFrame.items
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ManagedTable(BaseTable):
     """Stores the definition of a managed table."""
 
-    _VALID_FORMATS: ClassVar[list[str]] = field(default=["delta"])
+    _VALID_FORMATS: ClassVar[frozenset[str]] = frozenset({"delta"})
 
 
 class ManagedTableDataset(BaseTableDataset):
@@ -47,6 +45,17 @@ class ManagedTableDataset(BaseTableDataset):
           table: names_and_ages
           dataframe_type: pandas
 
+    Overwrites keep the schema of the existing table unless ``overwrite_schema``
+    is set, which lets Delta replace it at the cost of a schema rewrite:
+
+    .. code-block:: yaml
+
+        names_and_ages_with_height:
+          type: databricks.ManagedTableDataset
+          table: names_and_ages_with_height
+          write_mode: overwrite
+          overwrite_schema: true
+
     Example usage for the
     `Python API <https://docs.kedro.org/en/stable/data/\
     advanced_data_catalog_usage.html>`_:
@@ -96,6 +105,7 @@ class ManagedTableDataset(BaseTableDataset):
         schema: dict[str, Any] | None = None,
         partition_columns: list[str] | None = None,
         owner_group: str | None = None,
+        overwrite_schema: bool = False,
         metadata: dict[str, Any] | None = None,
     ) -> None:
         """Creates a new instance of ``ManagedTableDataset``.
@@ -126,6 +136,9 @@ class ManagedTableDataset(BaseTableDataset):
             owner_group: If table access control is enabled in your workspace,
                 specifying owner_group will transfer ownership of the table and database to
                 this owner. All databases should have the same owner_group. Defaults to None.
+            overwrite_schema: Whether an overwrite may also replace the schema
+                of the table. Applicable only for write_mode "overwrite".
+                Defaults to False.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
         Raises:
@@ -143,6 +156,7 @@ class ManagedTableDataset(BaseTableDataset):
             metadata=metadata,
             primary_key=primary_key,
             owner_group=owner_group,
+            overwrite_schema=overwrite_schema,
         )
 
     def _create_table(  # noqa: PLR0913
@@ -158,6 +172,7 @@ class ManagedTableDataset(BaseTableDataset):
         json_schema: dict[str, Any] | None,
         partition_columns: list[str] | None,
         owner_group: str | None,
+        overwrite_schema: bool = False,
     ) -> ManagedTable:
         """Creates a new ``ManagedTable`` instance with the provided attributes.
 
@@ -172,6 +187,7 @@ class ManagedTableDataset(BaseTableDataset):
             json_schema: The JSON schema of the table.
             partition_columns: The partition columns of the table.
             owner_group: The owner group of the table.
+            overwrite_schema: Whether overwrites may replace the table schema.
 
         Returns:
             ``ManagedTable``: The new ``ManagedTable`` instance.
@@ -188,6 +204,7 @@ class ManagedTableDataset(BaseTableDataset):
             owner_group=owner_group,
             primary_key=primary_key,
             format=format,
+            overwrite_schema=overwrite_schema,
         )
 
     def _describe(self) -> dict[str, str | list | None]:
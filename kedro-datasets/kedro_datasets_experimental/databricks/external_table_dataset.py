@@ -5,16 +5,16 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
 from kedro.io.core import DatasetError
-from pyspark.sql import DataFrame
 
 from kedro_datasets.databricks._base_table_dataset import BaseTable, BaseTableDataset
 
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame
+
 logger = logging.getLogger(__name__)
-pd.DataFrame.iteritems = pd.DataFrame.items
 
 
 @dataclass(frozen=True)
@@ -123,7 +123,8 @@ class ExternalTableDataset(BaseTableDataset):
         primary_key: str | list[str] | None,
         json_schema: dict[str, Any] | None,
         partition_columns: list[str] | None,
-        owner_group: str | None
+        owner_group: str | None,
+        overwrite_schema: bool = False,
     ) -> ExternalTable:
         """Creates a new ``ExternalTable`` instance with the provided attributes.
         Args:
@@ -138,6 +139,7 @@ class ExternalTableDataset(BaseTableDataset):
             json_schema: The JSON schema of the table.
             partition_columns: The partition columns of the table.
             owner_group: The owner group of the table.
+            overwrite_schema: Whether overwrites may replace the table schema.
         Returns:
             ``ExternalTable``: The new ``ExternalTable`` instance.
         """
@@ -152,7 +154,8 @@ class ExternalTableDataset(BaseTableDataset):
             partition_columns=partition_columns,
             owner_group=owner_group,
             primary_key=primary_key,
-            format=format
+            format=format,
+            overwrite_schema=overwrite_schema,
         )
 
     def _save_overwrite(self, data: DataFrame) -> None:
@@ -160,9 +163,10 @@ class ExternalTableDataset(BaseTableDataset):
         Args:
             data (DataFrame): The Spark dataframe to overwrite the table with.
         """
-        writer = data.write.format(self._table.format).mode("overwrite").option(
-            "overwriteSchema", "true"
-        )
+        writer = data.write.format(self._table.format).mode("overwrite")
+
+        if self._table.overwrite_schema:
+            writer.option("overwriteSchema", "true")
 
         if self._table.partition_columns:
             writer.partitionBy(
@@ -173,7 +177,7 @@ class ExternalTableDataset(BaseTableDataset):
             if self._table.location:
                 writer.option("path", self._table.location)
 
-            writer.saveAsTable(self._table.full_table_location() or "")
+            writer.saveAsTable(self._table.full_table_location())
 
         else:
             writer.save(self._table.location)
@@ -1,6 +1,7 @@
 import pytest
 from kedro.io.core import DatasetError
 from pyspark.sql import DataFrame
+from pyspark.sql.types import IntegerType, StringType, StructField, StructType
 
 from kedro_datasets_experimental.databricks.external_table_dataset import (
     ExternalTableDataset,
@@ -24,6 +25,36 @@ class TestExternalTableDataset:
         with pytest.raises(DatasetError):
             ExternalTableDataset(table="test", write_mode="overwrite", format="delta")
 
+    def test_schema(self, external_location: str):
+        unity_ds = ExternalTableDataset(
+            table="test_schema",
+            location=f"{external_location}/test_schema",
+            schema={
+                "fields": [
+                    {
+                        "metadata": {},
+                        "name": "name",
+                        "nullable": True,
+                        "type": "string",
+                    },
+                    {
+                        "metadata": {},
+                        "name": "age",
+                        "nullable": True,
+                        "type": "integer",
+                    },
+                ],
+                "type": "struct",
+            },
+        )
+        expected_schema = StructType(
+            [
+                StructField("name", StringType(), True),
+                StructField("age", IntegerType(), True),
+            ]
+        )
+        assert unity_ds._table.schema() == expected_schema
+
     def test_save_overwrite(
         self,
         sample_spark_df: DataFrame,
@@ -3,8 +3,13 @@ import pytest
 from kedro.io.core import DatasetError, Version, VersionNotFoundError
 from pyspark.sql import DataFrame
 from pyspark.sql.types import IntegerType, StringType, StructField, StructType
+from pyspark.sql.utils import ParseException
 
-from kedro_datasets.databricks._base_table_dataset import BaseTableDataset
+from kedro_datasets.databricks._base_table_dataset import (
+    BaseTable,
+    BaseTableDataset,
+    WriteMode,
+)
 
 
 class TestBaseTableDataset:
@@ -44,6 +49,11 @@ class TestBaseTableDataset:
         with pytest.raises(DatasetError):
             BaseTableDataset(table="test", write_mode="invalid")
 
+    def test_write_mode_enum(self):
+        unity_ds = BaseTableDataset(table="test", write_mode="append")
+        assert unity_ds._table.write_mode is WriteMode.APPEND
+        assert f"{unity_ds._table.write_mode}" == "append"
+
     def test_dataframe_type(self):
         with pytest.raises(DatasetError):
             BaseTableDataset(table="test", dataframe_type="invalid")
@@ -96,6 +106,7 @@ class TestBaseTableDataset:
             ]
         )
         assert unity_ds._table.schema() == expected_schema
+        assert unity_ds._table.schema() is unity_ds._table.schema()
 
     def test_invalid_schema(self):
         with pytest.raises(DatasetError):
@@ -121,6 +132,39 @@ class TestBaseTableDataset:
         unity_ds = BaseTableDataset(database="invalid", table="test_not_there")
         assert not unity_ds._exists()
 
+    def test_exists_falls_back_to_current_catalog(self, mocker):
+        spark = mocker.patch(
+            "kedro_datasets.databricks._base_table_dataset.get_spark"
+        ).return_value
+        spark.catalog.tableExists.side_effect = [ParseException("unsupported"), True]
+        unity_ds = BaseTableDataset(catalog="test", database="test", table="test")
+
+        assert unity_ds._exists()
+        spark.sql.assert_called_once_with("USE CATALOG `test`")
+        spark.catalog.tableExists.assert_called_with("test", "test")
+
+    def test_exists_without_table_exists(self, mocker):
+        spark = mocker.patch(
+            "kedro_datasets.databricks._base_table_dataset.get_spark"
+        ).return_value
+        del spark.catalog.tableExists
+        spark.sql.return_value.filter.return_value.count.return_value = 1
+        unity_ds = BaseTableDataset(database="test", table="test")
+
+        assert unity_ds._exists()
+        spark.sql.assert_called_once_with("SHOW TABLES IN `test`")
+        spark.sql.return_value.filter.assert_called_once_with("tableName = 'test'")
+
+    def test_exists_cached_after_save(self, sample_spark_df: DataFrame, mocker):
+        unity_ds = BaseTableDataset(
+            database="test", table="test_exists_cached", write_mode="overwrite"
+        )
+        unity_ds.save(sample_spark_df)
+
+        exists_mock = mocker.patch.object(BaseTable, "exists")
+        assert unity_ds._exists()
+        exists_mock.assert_not_called()
+
     def test_save_default(self, sample_spark_df: DataFrame):
         unity_ds = BaseTableDataset(database="test", table="test_save")
         with pytest.raises(DatasetError):
@@ -189,6 +233,72 @@ class TestBaseTableDataset:
         saved_table = saved_ds.load()
         assert subset_expected_df.exceptAll(saved_table).count() == 0
 
+    def test_load_schema_spark(
+        self, subset_spark_df: DataFrame, subset_expected_df: DataFrame
+    ):
+        unity_ds = BaseTableDataset(
+            database="test", table="test_load_spark_schema", write_mode="overwrite"
+        )
+        unity_ds.save(subset_spark_df)
+
+        spark_ds = BaseTableDataset(
+            database="test",
+            table="test_load_spark_schema",
+            schema={
+                "fields": [
+                    {
+                        "metadata": {},
+                        "name": "name",
+                        "nullable": True,
+                        "type": "string",
+                    },
+                    {
+                        "metadata": {},
+                        "name": "age",
+                        "nullable": True,
+                        "type": "integer",
+                    },
+                ],
+                "type": "struct",
+            },
+        )
+        spark_df = spark_ds.load()
+
+        assert spark_df.columns == ["name", "age"]
+        assert subset_expected_df.exceptAll(spark_df).count() == 0
+
+    def test_load_schema_pandas(self, subset_spark_df: DataFrame):
+        unity_ds = BaseTableDataset(
+            database="test", table="test_load_pd_schema", write_mode="overwrite"
+        )
+        unity_ds.save(subset_spark_df)
+
+        pandas_ds = BaseTableDataset(
+            database="test",
+            table="test_load_pd_schema",
+            dataframe_type="pandas",
+            schema={
+                "fields": [
+                    {
+                        "metadata": {},
+                        "name": "name",
+                        "nullable": True,
+                        "type": "string",
+                    },
+                    {
+                        "metadata": {},
+                        "name": "age",
+                        "nullable": True,
+                        "type": "integer",
+                    },
+                ],
+                "type": "struct",
+            },
+        )
+        pandas_df = pandas_ds.load()
+
+        assert list(pandas_df.columns) == ["name", "age"]
+
     def test_save_overwrite(
         self, sample_spark_df: DataFrame, append_spark_df: DataFrame
     ):
@@ -202,6 +312,34 @@ class TestBaseTableDataset:
 
         assert append_spark_df.exceptAll(overwritten_table).count() == 0
 
+    def test_save_overwrite_schema(
+        self, sample_spark_df: DataFrame, subset_spark_df: DataFrame
+    ):
+        unity_ds = BaseTableDataset(
+            database="test",
+            table="test_save_overwrite_schema",
+            write_mode="overwrite",
+            overwrite_schema=True,
+        )
+        unity_ds.save(sample_spark_df)
+        unity_ds.save(subset_spark_df)
+
+        overwritten_table = unity_ds.load()
+
+        assert subset_spark_df.exceptAll(overwritten_table).count() == 0
+
+    def test_save_overwrite_schema_mismatch(
+        self, sample_spark_df: DataFrame, subset_spark_df: DataFrame
+    ):
+        unity_ds = BaseTableDataset(
+            database="test",
+            table="test_save_overwrite_schema_mismatch",
+            write_mode="overwrite",
+        )
+        unity_ds.save(sample_spark_df)
+        with pytest.raises(DatasetError):
+            unity_ds.save(subset_spark_df)
+
     def test_save_overwrite_partitioned(
         self, sample_spark_df: DataFrame, append_spark_df: DataFrame
     ):